@@ -13,35 +13,63 @@ echo "Target: $MODELS_DIR (bundled with app)"
 echo "No authentication required - public models"
 echo ""
 
-# Download speaker segmentation model (VAD/segmentation)
-echo "1. Downloading speaker segmentation model..."
 cd "$MODELS_DIR"
 
-# Download the pyannote segmentation model from sherpa-onnx
-wget -q --show-progress \
-  "https://github.com/k2-fsa/sherpa-onnx/releases/download/speaker-segmentation-models/sherpa-onnx-pyannote-segmentation-3-0.tar.bz2" \
-  -O segmentation.tar.bz2
+# Release assets are immutable, so an existing non-empty file is already
+# the right one. Downloads land in a .part file first, so a present target
+# is always complete. Delete a model to force it to be fetched again.
 
-echo "   Extracting..."
-tar xf segmentation.tar.bz2
-mv sherpa-onnx-pyannote-segmentation-3-0/model.onnx segmentation.onnx
-rm -rf sherpa-onnx-pyannote-segmentation-3-0 segmentation.tar.bz2
+# Download speaker segmentation model (VAD/segmentation)
+fetch_segmentation() {
+  if [ -s segmentation.onnx ]; then
+    echo "   ✓ segmentation.onnx already present, skipping download"
+    return 0
+  fi
 
-echo "   ✓ Segmentation model saved to: segmentation.onnx"
-echo "   ✓ Size: $(du -h segmentation.onnx | cut -f1)"
+  # Download the pyannote segmentation model from sherpa-onnx, streaming the
+  # archive straight into tar so only model.onnx ever touches the disk
+  wget -q --show-progress \
+    "https://github.com/k2-fsa/sherpa-onnx/releases/download/speaker-segmentation-models/sherpa-onnx-pyannote-segmentation-3-0.tar.bz2" \
+    -O - \
+    | tar xjOf - sherpa-onnx-pyannote-segmentation-3-0/model.onnx > segmentation.onnx.part \
+    && mv segmentation.onnx.part segmentation.onnx
+}
 
 # Download speaker embedding model
-echo ""
-echo "2. Downloading speaker embedding model..."
-wget -q --show-progress \
-  "https://github.com/k2-fsa/sherpa-onnx/releases/download/speaker-recongition-models/3dspeaker_speech_eres2net_base_sv_zh-cn_3dspeaker_16k.onnx" \
-  -O embedding.onnx
+fetch_embedding() {
+  if [ -s embedding.onnx ]; then
+    echo "   ✓ embedding.onnx already present, skipping download"
+    return 0
+  fi
+
+  # -c resumes an interrupted download from the bytes already in the .part file
+  wget -q --show-progress -c \
+    "https://github.com/k2-fsa/sherpa-onnx/releases/download/speaker-recongition-models/3dspeaker_speech_eres2net_base_sv_zh-cn_3dspeaker_16k.onnx" \
+    -O embedding.onnx.part \
+    && mv embedding.onnx.part embedding.onnx
+}
 
+# The two downloads are independent, so run them concurrently
+echo "Downloading segmentation and embedding models..."
+fetch_segmentation &
+SEG_PID=$!
+fetch_embedding &
+EMB_PID=$!
+
+FAILED=0
+wait "$SEG_PID" || { echo "   ✗ Failed to download segmentation model"; FAILED=1; }
+wait "$EMB_PID" || { echo "   ✗ Failed to download embedding model"; FAILED=1; }
+if [ "$FAILED" -ne 0 ]; then
+  exit 1
+fi
+
+echo ""
+echo "   ✓ Segmentation model saved to: segmentation.onnx"
 echo "   ✓ Embedding model saved to: embedding.onnx"
-echo "   ✓ Size: $(du -h embedding.onnx | cut -f1)"
 
 echo ""
 echo "✅ Models downloaded successfully!"
 echo ""
 echo "These are proper ONNX models that can be loaded with ort in Rust."
-ls -lh "$MODELS_DIR"/*.onnx
\ No newline at end of file
+# Already inside $MODELS_DIR; one listing reports both sizes
+ls -lh segmentation.onnx embedding.onnx